@@ -15,8 +15,9 @@ class DataButtonsPanel:
 
     @classmethod
     def poll(cls, context):
-        engine = context.scene.render.engine
-        return hasattr(context, "curves") and context.curves and (engine in cls.COMPAT_ENGINES)
+        if not getattr(context, "curves", None):
+            return False
+        return context.scene.render.engine in cls.COMPAT_ENGINES
 
 
 class DATA_PT_context_curves(DataButtonsPanel, Panel):
@@ -51,24 +52,25 @@ class DATA_PT_curves_surface(DataButtonsPanel, Panel):
 
     def draw(self, context):
         layout = self.layout
-        ob = context.object
+        curves = context.object.data
+        surface = curves.surface
 
         layout.use_property_split = True
 
-        layout.prop(ob.data, "surface")
-        has_surface = ob.data.surface is not None
+        layout.prop(curves, "surface")
+        has_surface = surface is not None
         if has_surface:
             layout.prop_search(
-                ob.data,
+                curves,
                 "surface_uv_map",
-                ob.data.surface.data,
+                surface.data,
                 "uv_layers",
                 text="UV Map",
                 icon='GROUP_UVS',
             )
         else:
             row = layout.row()
-            row.prop(ob.data, "surface_uv_map", text="UV Map")
+            row.prop(curves, "surface_uv_map", text="UV Map")
             row.active = has_surface
 
 
@@ -111,10 +113,14 @@ class CURVES_MT_add_attribute(Menu):
 
 
 class CURVES_UL_attributes(UIList):
+    # Enum items of the attribute `data_type` and `domain` properties, looked up on first draw.
+    _data_type_enum = None
+    _domain_enum = None
+
     def filter_items(self, _context, data, property):
         attributes = getattr(data, property)
         flags = []
-        indices = [i for i in range(len(attributes))]
+        indices = []
 
         # Filtering by name
         if self.filter_name:
@@ -126,17 +132,24 @@ class CURVES_UL_attributes(UIList):
 
         # Filtering internal attributes
         for idx, item in enumerate(attributes):
-            flags[idx] = 0 if item.is_internal else flags[idx]
+            if item.is_internal:
+                flags[idx] = 0
 
-        # Reorder by name.
-        if self.use_filter_sort_alpha:
+        # Reorder by name, unless every item has been filtered out.
+        if self.use_filter_sort_alpha and any(flags):
             indices = bpy.types.UI_UL_list.sort_items_by_name(attributes, "name")
 
         return flags, indices
 
     def draw_item(self, _context, layout, _data, attribute, _icon, _active_data, _active_propname, _index):
-        data_type = attribute.bl_rna.properties["data_type"].enum_items[attribute.data_type]
-        domain = attribute.bl_rna.properties["domain"].enum_items[attribute.domain]
+        cls = type(self)
+        if cls._data_type_enum is None:
+            props = attribute.bl_rna.properties
+            cls._data_type_enum = props["data_type"].enum_items
+            cls._domain_enum = props["domain"].enum_items
+
+        data_type = cls._data_type_enum[attribute.data_type]
+        domain = cls._domain_enum[attribute.domain]
 
         split = layout.split(factor=0.5)
         split.emboss = 'NONE'